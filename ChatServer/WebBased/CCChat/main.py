@@ -13,6 +13,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI()
 
+# Keepalive frame sent by the CC computer every 30 seconds (textutils.serializeJSON output)
+PING_TEXT = '{"type":"ping"}'
+
 class PostPacket(BaseModel):
     message: str
     name: str
@@ -45,9 +48,11 @@ class ConnectionManager:
     async def send_message(self, server_name: str, message: dict):
         """Send a message to all WebSocket clients connected to this server"""
         if server_name in self.active_connections:
+            # Serialize once for every client instead of once per send_json call
+            text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
             for connection in self.active_connections[server_name]:
                 try:
-                    await connection.send_json(message)
+                    await connection.send_text(text)
                 except Exception as e:
                     print(f"Error sending to WebSocket: {e}")
 
@@ -68,13 +73,11 @@ class ConnectionManager:
     async def broadcast_ack(self, server_name: str, msg_id: int):
         """Broadcast ack to all SSE clients listening for this server"""
         print(f"[ACK] Broadcasting ack for message {msg_id} on server {server_name}")
-        print(f"[ACK] Active SSE queues: {list(self.ack_queues.keys())}")
         if server_name in self.ack_queues:
             print(f"[ACK] Found {len(self.ack_queues[server_name])} SSE clients")
             for queue in self.ack_queues[server_name]:
                 try:
                     await queue.put({"type": "ack", "id": msg_id})
-                    print(f"[ACK] Sent ack to SSE client")
                 except Exception as e:
                     print(f"[ACK] Error broadcasting ack: {e}")
         else:
@@ -87,7 +90,6 @@ class ConnectionManager:
             for queue in self.ack_queues[server_name]:
                 try:
                     await queue.put({"type": "failed", "id": msg_id})
-                    print(f"[FAIL] Sent failure to SSE client")
                 except Exception as e:
                     print(f"[FAIL] Error broadcasting failure: {e}")
 
@@ -316,7 +318,6 @@ async def postMessagePacket(serverName: str, packet: PostPacket):
 
 @app.get("/api/messages/{serverName}")
 async def getMessagePacket(serverName: str):
-    print(serverName)
     if serverName in messages:
         return messages[serverName]
     else:
@@ -365,7 +366,6 @@ async def sse_endpoint(serverName: str):
                 try:
                     # Wait for ack events with timeout to send keepalives
                     event = await asyncio.wait_for(queue.get(), timeout=15.0)
-                    print(f"[SSE] Sending event to client: {event}")
                     yield f"data: {json.dumps(event)}\n\n"
                 except asyncio.TimeoutError:
                     # Send keepalive comment every 15 seconds
@@ -403,7 +403,13 @@ async def websocket_endpoint(websocket: WebSocket, serverName: str):
 
         # Keep connection alive and handle incoming messages (like acks)
         while True:
-            data = await websocket.receive_json()
+            text = await websocket.receive_text()
+
+            # Keepalive pings need no reply, so skip parsing them entirely
+            if text == PING_TEXT:
+                continue
+
+            data = json.loads(text)
 
             # Handle ack from CC computer
             if data.get("type") == "ack":
@@ -448,6 +454,11 @@ async def cleanup_expired_messages():
             if expired:
                 print(f"[CLEANUP] Removed {len(expired)} expired messages from {server_name}")
 
+            # Drop empty queues for servers with no CC computer connected so that
+            # posts to arbitrary server names don't grow the dict forever
+            if not msg_list and server_name not in manager.active_connections:
+                del messages[server_name]
+
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks on server startup"""